@@ -10,6 +10,7 @@ import hmac
 import base64
 import asyncio
 import re
+import functools
 from datetime import datetime
 from datetime import timezone
 from enum import Enum
@@ -27,6 +28,14 @@ RESOURCE_PREFIX = '/v1/api/'
 
 VERB = "POST"
 
+# Empty MD5 state, copied for each new body digest
+_MD5_TEMPLATE = hashlib.md5()
+
+# Date formats accepted by the API, compiled once at import
+_DAY_RE = re.compile("^[0-9]{4}-[0-9]{2}-[0-9]{2}$")
+_MONTH_RE = re.compile("^[0-9]{4}-[0-9]{2}$")
+_YEAR_RE = re.compile("^[0-9]{4}$")
+
 # Endpoints
 USER_STATION_LIST = RESOURCE_PREFIX + 'userStationList'
 STATION_DETAIL = RESOURCE_PREFIX + 'stationDetail'
@@ -137,6 +146,7 @@ error code: {self.code}, response: {self.response}'
     def __init__(self, domain: str, session: ClientSession) -> None:
         self._domain = domain.rstrip("/")
         self._session: ClientSession = session
+        self._urls: dict[str, str] = {}
 
     class DateFormat(Enum):
         DAY = 0
@@ -717,7 +727,7 @@ error code: {self.code}, response: {self.response}'
         header: dict[str, str] = SoliscloudAPI._prepare_header(
             key_id, secret, params, canonicalized_resource)
 
-        url = f"{self.domain}{canonicalized_resource}"
+        url = self._url(canonicalized_resource)
         try:
             result = await self._post_data_json(url, header, params)
             if 'page' in result.keys():
@@ -738,11 +748,19 @@ error code: {self.code}, response: {self.response}'
         header: dict[str, str] = SoliscloudAPI._prepare_header(
             key_id, secret, params, canonicalized_resource)
 
-        url = f"{self.domain}{canonicalized_resource}"
+        url = self._url(canonicalized_resource)
         result = await self._post_data_json(url, header, params)
 
         return result
 
+    def _url(self, canonicalized_resource: str) -> str:
+        """ Full url for canonicalized_resource, cached per endpoint."""
+        url = self._urls.get(canonicalized_resource)
+        if url is None:
+            url = f"{self.domain}{canonicalized_resource}"
+            self._urls[canonicalized_resource] = url
+        return url
+
     @staticmethod
     def _now() -> datetime.datetime:
         return datetime.now(timezone.utc)
@@ -754,10 +772,8 @@ error code: {self.code}, response: {self.response}'
         body: dict[str, str],
         canonicalized_resource: str
     ) -> dict[str, str]:
-        content_md5 = base64.b64encode(
-            hashlib.md5(json.dumps(body, separators=(
-                ",", ":")).encode('utf-8')).digest()
-        ).decode('utf-8')
+        content_md5 = SoliscloudAPI._content_md5(
+            json.dumps(body, separators=(",", ":")).encode('utf-8'))
 
         content_type = "application/json"
 
@@ -770,12 +786,8 @@ error code: {self.code}, response: {self.response}'
             + date + "\n"
             + canonicalized_resource
         )
-        hmac_obj = hmac.new(
-            secret,
-            msg=encrypt_str.encode('utf-8'),
-            digestmod=hashlib.sha1
-        )
-        sign = base64.b64encode(hmac_obj.digest())
+        sign = base64.b64encode(
+            hmac.digest(secret, encrypt_str.encode('utf-8'), 'sha1'))
         authorization = "API " + key_id + ":" + sign.decode('utf-8')
 
         header: dict[str, str] = {
@@ -786,6 +798,14 @@ error code: {self.code}, response: {self.response}'
         }
         return header
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _content_md5(body: bytes) -> str:
+        """ Base64 encoded MD5 digest of body, cached per body."""
+        md5 = _MD5_TEMPLATE.copy()
+        md5.update(body)
+        return base64.b64encode(md5.digest()).decode('utf-8')
+
     @throttle(rate_limit=2, period=1.0)
     async def _post_data_json(
         self,
@@ -837,16 +857,14 @@ error code: {self.code}, response: {self.response}'
 
     @staticmethod
     def _verify_date(format: SoliscloudAPI.DateFormat, date: str):
-        rex = re.compile("^[0-9]{4}-[0-9]{2}-[0-9]{2}$")
-        err = SoliscloudAPI.SolisCloudError(
-            "time must be in format YYYY-MM-DD")
+        rex = _DAY_RE
+        err = "time must be in format YYYY-MM-DD"
         if format == SoliscloudAPI.DateFormat.MONTH:
-            rex = re.compile("^[0-9]{4}-[0-9]{2}$")
-            err = SoliscloudAPI.SolisCloudError(
-                "month must be in format YYYY-MM")
+            rex = _MONTH_RE
+            err = "month must be in format YYYY-MM"
         elif format == SoliscloudAPI.DateFormat.YEAR:
-            rex = re.compile("^[0-9]{4}$")
-            err = SoliscloudAPI.SolisCloudError("year must be in format YYYY")
+            rex = _YEAR_RE
+            err = "year must be in format YYYY"
         if not rex.match(date):
-            raise err
+            raise SoliscloudAPI.SolisCloudError(err)
         return
@@ -19,10 +19,7 @@ class Helpers():
         """
         response = await api.user_station_list(
             key, secret, page_no=1, page_size=100, nmi_code=nmi)
-        stations = ()
-        for element in response:
-            stations = stations + (int(element['id']),)
-        return stations
+        return tuple(int(element['id']) for element in response)
 
     @staticmethod
     async def get_inverter_ids(
@@ -38,7 +35,4 @@ class Helpers():
         response = await api.inverter_list(
             key, secret, page_no=1, page_size=100,
             station_id=station_id, nmi_code=nmi)
-        inverters = ()
-        for element in response:
-            inverters = inverters + (int(element['id']),)
-        return inverters
+        return tuple(int(element['id']) for element in response)
@@ -0,0 +1,48 @@
+import pytest
+from unittest.mock import AsyncMock
+import soliscloud_api as api
+
+from .const import (
+    VALID_RESPONSE,
+    VALID_RESPONSE_LIST,
+    VALID_RESPONSE_PAGED_RECORDS,
+    VALID_RESPONSE_RECORDS
+)
+
+
+@pytest.fixture(scope="module")
+def api_instance():
+    instance = api.SoliscloudAPI('https://soliscloud_test.com:13333', 1)
+
+    return instance
+
+
+@pytest.fixture
+def patch_api(api_instance, monkeypatch):
+    # api_instance is shared by the module, monkeypatch restores it
+    def _patch(method, return_value):
+        monkeypatch.setattr(
+            api_instance, method, AsyncMock(return_value=return_value))
+        return api_instance
+
+    return _patch
+
+
+@pytest.fixture
+def patched_api(patch_api):
+    return patch_api('_get_data', VALID_RESPONSE)
+
+
+@pytest.fixture
+def patched_api_list(patch_api):
+    return patch_api('_get_data', VALID_RESPONSE_LIST)
+
+
+@pytest.fixture
+def patched_api_paged(patch_api):
+    return patch_api('_get_records', VALID_RESPONSE_PAGED_RECORDS)
+
+
+@pytest.fixture
+def patched_api_records(patch_api):
+    return patch_api('_get_records', VALID_RESPONSE_RECORDS)
@@ -24,3 +24,6 @@ VALID_RESPONSE_PAGED_RECORDS = {
     'code': '0',
     'msg': 'success',
     'data': {'page': {'records': [{'item': 1}, {'item': 2}]}}}
+
+# Paging parameters sent when page_no and page_size are not given
+DEFAULT_PAGING = {'pageNo': 1, 'pageSize': 20}
@@ -64,6 +64,15 @@ def test_prepare_header(mocker):
     assert header == VALID_HEADER
 
 
+def test_content_md5():
+    body = b'{"pageNo":1,"pageSize":100}'
+    assert SoliscloudAPI._content_md5(body) == VALID_HEADER['Content-MD5']
+    # Repeated bodies are served from the cache
+    hits = SoliscloudAPI._content_md5.cache_info().hits
+    assert SoliscloudAPI._content_md5(body) == VALID_HEADER['Content-MD5']
+    assert SoliscloudAPI._content_md5.cache_info().hits == hits + 1
+
+
 @pytest.mark.asyncio
 async def test_post_data_json(api_instance, mocker):
     mocker.patch(
@@ -125,6 +134,21 @@ async def test_post_data_json_fail(api_instance, mocker):
             {'test': 'test'})
 
 
+def test_url(api_instance):
+    url = api_instance._url('/TEST')
+    assert url == 'https://soliscloud_test.com:13333/TEST'
+    assert api_instance._url('/TEST') is url
+
+
+def test_verify_date():
+    date_format = SoliscloudAPI.DateFormat
+    SoliscloudAPI._verify_date(date_format.DAY, '2023-01-01')
+    SoliscloudAPI._verify_date(date_format.MONTH, '2023-01')
+    SoliscloudAPI._verify_date(date_format.YEAR, '2023')
+    with pytest.raises(SoliscloudAPI.SolisCloudError):
+        SoliscloudAPI._verify_date(date_format.MONTH, '2023-01-01')
+
+
 @pytest.mark.asyncio
 async def test_get_data(api_instance, mocker):
     mocker.patch.object(
@@ -1,8 +1,8 @@
 import pytest
 import soliscloud_api as api
 
-# from soliscloud_api import *
 from .const import (
+    DEFAULT_PAGING,
     KEY,
     SECRET,
     NMI,
@@ -13,68 +13,19 @@ from .const import (
 )
 
 
-@pytest.fixture
-def api_instance():
-    instance = api.SoliscloudAPI('https://soliscloud_test.com:13333', 1)
-
-    return instance
-
-
-@pytest.fixture
-def patched_api(api_instance, mocker):
-    mocked_class = mocker.create_autospec(api.SoliscloudAPI)
-    mocker.patch.object(mocked_class, '_get_data',
-                        return_value=VALID_RESPONSE)
-    mocker.patch.object(api_instance, '_get_data', mocked_class._get_data)
-
-    return mocked_class
-
-
-@pytest.fixture
-def patched_api_list(api_instance, mocker):
-    mocked_class = mocker.create_autospec(api.SoliscloudAPI)
-    mocker.patch.object(mocked_class, '_get_data',
-                        return_value=VALID_RESPONSE_LIST)
-    mocker.patch.object(api_instance, '_get_data', mocked_class._get_data)
-
-    return mocked_class
-
-
-@pytest.fixture
-def patched_api_paged(api_instance, mocker):
-    mocked_class = mocker.create_autospec(api.SoliscloudAPI)
-    mocker.patch.object(mocked_class, '_get_records',
-                        return_value=VALID_RESPONSE_PAGED_RECORDS)
-    mocker.patch.object(api_instance, '_get_records',
-                        mocked_class._get_records)
-
-    return mocked_class
-
-
-@pytest.fixture
-def patched_api_records(api_instance, mocker):
-    mocked_class = mocker.create_autospec(api.SoliscloudAPI)
-    mocker.patch.object(mocked_class, '_get_records',
-                        return_value=VALID_RESPONSE_RECORDS)
-    mocker.patch.object(api_instance, '_get_records',
-                        mocked_class._get_records)
-
-    return mocked_class
-
-
 @pytest.mark.asyncio
 async def test_inverter_list_valid(api_instance, patched_api_paged):
     # Required arguments only
     result = await api_instance.inverter_list(KEY, SECRET)
-    assert result == VALID_RESPONSE_PAGED_RECORDS
+    assert result is VALID_RESPONSE_PAGED_RECORDS
     patched_api_paged._get_records.assert_called_with(
-        api.INVERTER_LIST, KEY, SECRET, {'pageNo': 1, 'pageSize': 20})
+        api.INVERTER_LIST, KEY, SECRET, DEFAULT_PAGING)
 
     # All arguments filled
     result = await api_instance.inverter_list(
         KEY, SECRET,
         page_no=4, page_size=100, station_id=1000, nmi_code=NMI)
-    assert result == VALID_RESPONSE_PAGED_RECORDS
+    assert result is VALID_RESPONSE_PAGED_RECORDS
     patched_api_paged._get_records.assert_called_with(
         api.INVERTER_LIST,
         KEY, SECRET,
@@ -86,44 +37,29 @@ async def test_inverter_list_valid(api_instance, patched_api_paged):
             'nmi_code'})
 
 
-@pytest.mark.asyncio
-async def test_inverter_list_invalid_page_size(api_instance):
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.inverter_list(KEY, SECRET, page_size=101)
-
-
 @pytest.mark.asyncio
 async def test_inverter_detail_valid(api_instance, patched_api):
     # Required arguments only
     result = await api_instance.inverter_detail(KEY, SECRET, inverter_sn=1000)
-    assert result == VALID_RESPONSE
+    assert result is VALID_RESPONSE
     patched_api._get_data.assert_called_with(
         api.INVERTER_DETAIL, KEY, SECRET, {'sn': 1000})
 
     result = await api_instance.inverter_detail(
         KEY, SECRET,
         inverter_id='1000')
-    assert result == VALID_RESPONSE
+    assert result is VALID_RESPONSE
     patched_api._get_data.assert_called_with(
         api.INVERTER_DETAIL, KEY, SECRET, {'id': '1000'})
 
 
-@pytest.mark.asyncio
-async def test_inverter_detail_invalid_params(api_instance):
-    # ID and SN together
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.inverter_detail(
-            KEY, SECRET,
-            inverter_sn=1000, inverter_id='1000')
-
-
 @pytest.mark.asyncio
 async def test_inverter_day_valid(api_instance, patched_api_list):
     # Required arguments only
     result = await api_instance.inverter_day(
         KEY, SECRET,
         currency='EUR', time='2023-01-01', time_zone=1, inverter_id='1000')
-    assert result == VALID_RESPONSE_LIST
+    assert result is VALID_RESPONSE_LIST
     patched_api_list._get_data.assert_called_with(
         api.INVERTER_DAY,
         KEY, SECRET,
@@ -132,53 +68,20 @@ async def test_inverter_day_valid(api_instance, patched_api_list):
     result = await api_instance.inverter_day(
         KEY, SECRET,
         currency='EUR', time='2023-01-01', time_zone=1, inverter_sn='sn')
-    assert result == VALID_RESPONSE_LIST
+    assert result is VALID_RESPONSE_LIST
     patched_api_list._get_data.assert_called_with(
         api.INVERTER_DAY,
         KEY, SECRET,
         {'money': 'EUR', 'time': '2023-01-01', 'timeZone': 1, 'sn': 'sn'})
 
 
-@pytest.mark.asyncio
-async def test_inverter_day_invalid_params(api_instance):
-    # ID and SN together
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.inverter_day(
-            KEY, SECRET,
-            currency='EUR', time='2023-01-01', time_zone=1)
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.inverter_day(
-            KEY, SECRET,
-            currency='EUR',
-            time='2023-01-01',
-            time_zone=1,
-            inverter_id='1000',
-            inverter_sn='sn')
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.inverter_day(
-            KEY, SECRET,
-            currency='EUR', time='2023', time_zone=1, inverter_id='1000')
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.inverter_day(
-            KEY, SECRET,
-            currency='EUR', time='2023+01-01', time_zone=1, inverter_id='1000')
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.inverter_day(
-            KEY, SECRET,
-            currency='EUR', time='2023-01+01', time_zone=1, inverter_id='1000')
-
-
 @pytest.mark.asyncio
 async def test_inverter_month_valid(api_instance, patched_api_list):
     # Required arguments only
     result = await api_instance.inverter_month(
         KEY, SECRET,
         currency='EUR', month='2023-01', inverter_id='1000')
-    assert result == VALID_RESPONSE_LIST
+    assert result is VALID_RESPONSE_LIST
     patched_api_list._get_data.assert_called_with(
         api.INVERTER_MONTH,
         KEY, SECRET,
@@ -187,47 +90,20 @@ async def test_inverter_month_valid(api_instance, patched_api_list):
     result = await api_instance.inverter_month(
         KEY, SECRET,
         currency='EUR', month='2023-01', inverter_sn='sn')
-    assert result == VALID_RESPONSE_LIST
+    assert result is VALID_RESPONSE_LIST
     patched_api_list._get_data.assert_called_with(
         api.INVERTER_MONTH,
         KEY, SECRET,
         {'money': 'EUR', 'month': '2023-01', 'sn': 'sn'})
 
 
-@pytest.mark.asyncio
-async def test_inverter_month_invalid_params(api_instance):
-    # ID and SN together
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.inverter_month(
-            KEY, SECRET,
-            currency='EUR', month='2023-01')
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.inverter_month(
-            KEY, SECRET,
-            currency='EUR',
-            month='2023-01',
-            inverter_id='1000',
-            inverter_sn='sn')
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.inverter_month(
-            KEY, SECRET,
-            currency='EUR', month='2023', inverter_id='1000')
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.inverter_month(
-            KEY, SECRET,
-            currency='EUR', month='2023+01', inverter_id='1000')
-
-
 @pytest.mark.asyncio
 async def test_inverter_year_valid(api_instance, patched_api_list):
     # Required arguments only
     result = await api_instance.inverter_year(
         KEY, SECRET,
         currency='EUR', year='2023', inverter_id='1000')
-    assert result == VALID_RESPONSE_LIST
+    assert result is VALID_RESPONSE_LIST
     patched_api_list._get_data.assert_called_with(
         api.INVERTER_YEAR,
         KEY, SECRET,
@@ -236,39 +112,20 @@ async def test_inverter_year_valid(api_instance, patched_api_list):
     result = await api_instance.inverter_year(
         KEY, SECRET,
         currency='EUR', year='2023', inverter_sn='sn')
-    assert result == VALID_RESPONSE_LIST
+    assert result is VALID_RESPONSE_LIST
     patched_api_list._get_data.assert_called_with(
         api.INVERTER_YEAR,
         KEY, SECRET,
         {'money': 'EUR', 'year': '2023', 'sn': 'sn'})
 
 
-@pytest.mark.asyncio
-async def test_inverter_year_invalid_params(api_instance):
-    # ID and SN together
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.inverter_year(
-            KEY, SECRET,
-            currency='EUR', year='2023')
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.inverter_year(
-            KEY, SECRET,
-            currency='EUR', year='2023', inverter_id='1000', inverter_sn='sn')
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.inverter_year(
-            KEY, SECRET,
-            currency='EUR', year='22023', inverter_id='1000')
-
-
 @pytest.mark.asyncio
 async def test_inverter_all_valid(api_instance, patched_api_list):
     # Required arguments only
     result = await api_instance.inverter_all(
         KEY, SECRET,
         currency='EUR', inverter_id='1000')
-    assert result == VALID_RESPONSE_LIST
+    assert result is VALID_RESPONSE_LIST
     patched_api_list._get_data.assert_called_with(
         api.INVERTER_ALL,
         KEY, SECRET,
@@ -277,81 +134,138 @@ async def test_inverter_all_valid(api_instance, patched_api_list):
     result = await api_instance.inverter_all(
         KEY, SECRET,
         currency='EUR', inverter_sn='sn')
-    assert result == VALID_RESPONSE_LIST
+    assert result is VALID_RESPONSE_LIST
     patched_api_list._get_data.assert_called_with(
         api.INVERTER_ALL,
         KEY, SECRET,
         {'money': 'EUR', 'sn': 'sn'})
 
 
-@pytest.mark.asyncio
-async def test_inverter_all_invalid_params(api_instance):
-    # ID and SN together
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.inverter_all(KEY, SECRET, currency='EUR')
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.inverter_all(
-            KEY, SECRET,
-            currency='EUR', inverter_id='1000', inverter_sn='sn')
-
-
 @pytest.mark.asyncio
 async def test_inverter_detail_list_valid(api_instance, patched_api_records):
     # Required arguments only
     result = await api_instance.inverter_detail_list(KEY, SECRET)
-    assert result == VALID_RESPONSE_RECORDS
+    assert result is VALID_RESPONSE_RECORDS
     patched_api_records._get_records.assert_called_with(
-        api.INVERTER_DETAIL_LIST, KEY, SECRET, {'pageNo': 1, 'pageSize': 20})
+        api.INVERTER_DETAIL_LIST, KEY, SECRET, DEFAULT_PAGING)
 
     result = await api_instance.inverter_detail_list(
         KEY, SECRET,
         page_no=4, page_size=30)
-    assert result == VALID_RESPONSE_RECORDS
+    assert result is VALID_RESPONSE_RECORDS
     patched_api_records._get_records.assert_called_with(
         api.INVERTER_DETAIL_LIST,
         KEY, SECRET,
         {'pageNo': 4, 'pageSize': 30})
 
 
-@pytest.mark.asyncio
-async def test_inverter_detail_list_invalid_params(api_instance):
-    # Wrong page_size
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.inverter_detail_list(KEY, SECRET, page_size=1000)
-
-
 @pytest.mark.asyncio
 async def test_inverter_shelf_time(api_instance, patched_api_records):
     # Required arguments only
     result = await api_instance.inverter_shelf_time(
         KEY, SECRET,
         inverter_sn='sn')
-    assert result == VALID_RESPONSE_RECORDS
+    assert result is VALID_RESPONSE_RECORDS
     patched_api_records._get_records.assert_called_with(
         api.INVERTER_SHELF_TIME,
         KEY, SECRET,
-        {'pageNo': 1, 'pageSize': 20, 'sn': 'sn'})
+        {**DEFAULT_PAGING, 'sn': 'sn'})
 
     # Optional arguments
     result = await api_instance.inverter_shelf_time(
         KEY, SECRET,
         page_no=50, page_size=50, inverter_sn='sn')
-    assert result == VALID_RESPONSE_RECORDS
+    assert result is VALID_RESPONSE_RECORDS
     patched_api_records._get_records.assert_called_with(
         api.INVERTER_SHELF_TIME,
         KEY, SECRET,
         {'pageNo': 50, 'pageSize': 50, 'sn': 'sn'})
 
 
+@pytest.mark.parametrize('method,kwargs', [
+    pytest.param(
+        'inverter_list', {'page_size': 101},
+        id='inverter-list'),
+    pytest.param(
+        'inverter_detail_list', {'page_size': 1000},
+        id='inverter-detail-list'),
+    pytest.param(
+        'inverter_shelf_time', {'page_size': 1000, 'inverter_sn': 'sn'},
+        id='inverter-shelf-time'),
+])
 @pytest.mark.asyncio
-async def test_inverter_shelf_time_invalid_params(api_instance):
-    # Wrong page_size
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.inverter_shelf_time(
-            KEY, SECRET,
-            page_size=1000, inverter_sn='sn')
-
-    # Wrong page_size
+async def test_invalid_page_size(api_instance, method, kwargs):
+    with pytest.raises(
+            api.SoliscloudAPI.SolisCloudError, match=api.PAGE_SIZE_ERR):
+        await getattr(api_instance, method)(KEY, SECRET, **kwargs)
+
+
+@pytest.mark.parametrize('method,kwargs,message', [
+    pytest.param(
+        'inverter_detail', {'inverter_sn': 1000, 'inverter_id': '1000'},
+        api.ONLY_INV_ID_OR_SN_ERR,
+        id='inverter-detail-both-id-and-sn'),
+    pytest.param(
+        'inverter_day', {
+            'currency': 'EUR', 'time': '2023-01-01', 'time_zone': 1},
+        api.ONLY_INV_ID_OR_SN_ERR,
+        id='inverter-day-no-id-and-no-sn'),
+    pytest.param(
+        'inverter_day', {
+            'currency': 'EUR', 'time': '2023-01-01', 'time_zone': 1,
+            'inverter_id': '1000', 'inverter_sn': 'sn'},
+        api.ONLY_INV_ID_OR_SN_ERR,
+        id='inverter-day-both-id-and-sn'),
+    pytest.param(
+        'inverter_month', {'currency': 'EUR', 'month': '2023-01'},
+        api.ONLY_INV_ID_OR_SN_ERR,
+        id='inverter-month-no-id-and-no-sn'),
+    pytest.param(
+        'inverter_month', {
+            'currency': 'EUR', 'month': '2023-01',
+            'inverter_id': '1000', 'inverter_sn': 'sn'},
+        api.ONLY_INV_ID_OR_SN_ERR,
+        id='inverter-month-both-id-and-sn'),
+    pytest.param(
+        'inverter_year', {'currency': 'EUR', 'year': '2023'},
+        api.ONLY_INV_ID_OR_SN_ERR,
+        id='inverter-year-no-id-and-no-sn'),
+    pytest.param(
+        'inverter_year', {
+            'currency': 'EUR', 'year': '2023',
+            'inverter_id': '1000', 'inverter_sn': 'sn'},
+        api.ONLY_INV_ID_OR_SN_ERR,
+        id='inverter-year-both-id-and-sn'),
+    pytest.param(
+        'inverter_all', {'currency': 'EUR'},
+        api.ONLY_INV_ID_OR_SN_ERR,
+        id='inverter-all-no-id-and-no-sn'),
+    pytest.param(
+        'inverter_all', {
+            'currency': 'EUR', 'inverter_id': '1000', 'inverter_sn': 'sn'},
+        api.ONLY_INV_ID_OR_SN_ERR,
+        id='inverter-all-both-id-and-sn'),
+    pytest.param(
+        'inverter_shelf_time', {'inverter_sn': None},
+        api.INV_SN_ERR,
+        id='inverter-shelf-time-no-sn'),
+])
+@pytest.mark.asyncio
+async def test_invalid_params(api_instance, method, kwargs, message):
+    with pytest.raises(api.SoliscloudAPI.SolisCloudError, match=message):
+        await getattr(api_instance, method)(KEY, SECRET, **kwargs)
+
+
+@pytest.mark.parametrize('method,kwargs', [
+    ('inverter_day', {'time': '2023', 'time_zone': 1}),
+    ('inverter_day', {'time': '2023+01-01', 'time_zone': 1}),
+    ('inverter_day', {'time': '2023-01+01', 'time_zone': 1}),
+    ('inverter_month', {'month': '2023'}),
+    ('inverter_month', {'month': '2023+01'}),
+    ('inverter_year', {'year': '22023'}),
+])
+@pytest.mark.asyncio
+async def test_invalid_date_format(api_instance, method, kwargs):
     with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.inverter_shelf_time(KEY, SECRET, inverter_sn=None)
+        await getattr(api_instance, method)(
+            KEY, SECRET, currency='EUR', inverter_id='1000', **kwargs)
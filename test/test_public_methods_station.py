@@ -1,8 +1,8 @@
 import pytest
 import soliscloud_api as api
 
-# from soliscloud_api import *
 from .const import (
+    DEFAULT_PAGING,
     KEY,
     SECRET,
     NMI,
@@ -13,86 +13,30 @@ from .const import (
 )
 
 
-@pytest.fixture
-def api_instance():
-    instance = api.SoliscloudAPI('https://soliscloud_test.com:13333', 1)
-
-    return instance
-
-
-@pytest.fixture
-def patched_api(api_instance, mocker):
-    mocked_class = mocker.create_autospec(api.SoliscloudAPI)
-    mocker.patch.object(mocked_class, '_get_data',
-                        return_value=VALID_RESPONSE)
-    mocker.patch.object(api_instance, '_get_data', mocked_class._get_data)
-
-    return mocked_class
-
-
-@pytest.fixture
-def patched_api_list(api_instance, mocker):
-    mocked_class = mocker.create_autospec(api.SoliscloudAPI)
-    mocker.patch.object(mocked_class, '_get_data',
-                        return_value=VALID_RESPONSE_LIST)
-    mocker.patch.object(api_instance, '_get_data', mocked_class._get_data)
-
-    return mocked_class
-
-
-@pytest.fixture
-def patched_api_paged(api_instance, mocker):
-    mocked_class = mocker.create_autospec(api.SoliscloudAPI)
-    mocker.patch.object(mocked_class, '_get_records',
-                        return_value=VALID_RESPONSE_PAGED_RECORDS)
-    mocker.patch.object(api_instance, '_get_records',
-                        mocked_class._get_records)
-
-    return mocked_class
-
-
-@pytest.fixture
-def patched_api_records(api_instance, mocker):
-    mocked_class = mocker.create_autospec(api.SoliscloudAPI)
-    mocker.patch.object(mocked_class, '_get_records',
-                        return_value=VALID_RESPONSE_RECORDS)
-    mocker.patch.object(api_instance, '_get_records',
-                        mocked_class._get_records)
-
-    return mocked_class
-
-
 @pytest.mark.asyncio
 async def test_user_station_list_valid(api_instance, patched_api_paged):
     # Required arguments only
     result = await api_instance.user_station_list(KEY, SECRET)
-    assert result == VALID_RESPONSE_PAGED_RECORDS
+    assert result is VALID_RESPONSE_PAGED_RECORDS
     patched_api_paged._get_records.assert_called_with(
-        api.USER_STATION_LIST, KEY, SECRET, {'pageNo': 1, 'pageSize': 20})
-    assert result == VALID_RESPONSE_PAGED_RECORDS
+        api.USER_STATION_LIST, KEY, SECRET, DEFAULT_PAGING)
 
     # All arguments filled
     result = await api_instance.user_station_list(
         KEY, SECRET,
         page_no=4, page_size=100, nmi_code=NMI)
-    assert result == VALID_RESPONSE_PAGED_RECORDS
+    assert result is VALID_RESPONSE_PAGED_RECORDS
     patched_api_paged._get_records.assert_called_with(
         api.USER_STATION_LIST,
         KEY, SECRET,
         {'pageNo': 4, 'pageSize': 100, 'nmiCode': 'nmi_code'})
 
 
-@pytest.mark.asyncio
-async def test_user_station_list_invalid_page_size(api_instance):
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.user_station_list(KEY, SECRET, page_size=101)
-
-
 @pytest.mark.asyncio
 async def test_station_detail_valid(api_instance, patched_api):
     # Required arguments only
     result = await api_instance.station_detail(KEY, SECRET, station_id=1000)
-    assert result == VALID_RESPONSE
+    assert result is VALID_RESPONSE
     patched_api._get_data.assert_called_with(
         api.STATION_DETAIL, KEY, SECRET, {'id': 1000})
 
@@ -100,7 +44,7 @@ async def test_station_detail_valid(api_instance, patched_api):
     result = await api_instance.station_detail(
         KEY, SECRET,
         station_id=1000, nmi_code=NMI)
-    assert result == VALID_RESPONSE
+    assert result is VALID_RESPONSE
     patched_api._get_data.assert_called_with(
         api.STATION_DETAIL,
         KEY, SECRET,
@@ -113,7 +57,7 @@ async def test_station_day_valid(api_instance, patched_api_list):
     result = await api_instance.station_day(
         KEY, SECRET,
         currency='EUR', time='2023-01-01', time_zone=1, station_id='1000')
-    assert result == VALID_RESPONSE_LIST
+    assert result is VALID_RESPONSE_LIST
     patched_api_list._get_data.assert_called_with(
         api.STATION_DAY,
         KEY, SECRET,
@@ -122,53 +66,20 @@ async def test_station_day_valid(api_instance, patched_api_list):
     result = await api_instance.station_day(
         KEY, SECRET,
         currency='EUR', time='2023-01-01', time_zone=1, nmi_code=NMI)
-    assert result == VALID_RESPONSE_LIST
+    assert result is VALID_RESPONSE_LIST
     patched_api_list._get_data.assert_called_with(
         api.STATION_DAY,
         KEY, SECRET,
         {'money': 'EUR', 'time': '2023-01-01', 'timeZone': 1, 'nmiCode': NMI})
 
 
-@pytest.mark.asyncio
-async def test_station_day_invalid_params(api_instance):
-    # ID and SN together
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_day(
-            KEY, SECRET,
-            currency='EUR', time='2023-01-01', time_zone=1)
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_day(
-            KEY, SECRET,
-            currency='EUR',
-            time='2023-01-01',
-            time_zone=1,
-            station_id='1000',
-            nmi_code=NMI)
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_day(
-            KEY, SECRET,
-            currency='EUR', time='2023', time_zone=1, station_id='1000')
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_day(
-            KEY, SECRET,
-            currency='EUR', time='2023+01-01', time_zone=1, station_id='1000')
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_day(
-            KEY, SECRET,
-            currency='EUR', time='2023-01+01', time_zone=1, station_id='1000')
-
-
 @pytest.mark.asyncio
 async def test_station_month_valid(api_instance, patched_api_list):
     # Required arguments only
     result = await api_instance.station_month(
         KEY, SECRET,
         currency='EUR', month='2023-01', station_id='1000')
-    assert result == VALID_RESPONSE_LIST
+    assert result is VALID_RESPONSE_LIST
     patched_api_list._get_data.assert_called_with(
         api.STATION_MONTH,
         KEY, SECRET,
@@ -177,44 +88,20 @@ async def test_station_month_valid(api_instance, patched_api_list):
     result = await api_instance.station_month(
         KEY, SECRET,
         currency='EUR', month='2023-01', nmi_code=NMI)
-    assert result == VALID_RESPONSE_LIST
+    assert result is VALID_RESPONSE_LIST
     patched_api_list._get_data.assert_called_with(
         api.STATION_MONTH,
         KEY, SECRET,
         {'money': 'EUR', 'month': '2023-01', 'nmiCode': NMI})
 
 
-@pytest.mark.asyncio
-async def test_station_month_invalid_params(api_instance):
-    # ID and SN together
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_month(
-            KEY, SECRET,
-            currency='EUR', month='2023-01')
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_month(
-            KEY, SECRET,
-            currency='EUR', month='2023-01', station_id='1000', nmi_code=NMI)
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_month(
-            KEY, SECRET,
-            currency='EUR', month='2023', station_id='1000')
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_month(
-            KEY, SECRET,
-            currency='EUR', month='2023+01', station_id='1000')
-
-
 @pytest.mark.asyncio
 async def test_station_year_valid(api_instance, patched_api_list):
     # Required arguments only
     result = await api_instance.station_year(
         KEY, SECRET,
         currency='EUR', year='2023', station_id='1000')
-    assert result == VALID_RESPONSE_LIST
+    assert result is VALID_RESPONSE_LIST
     patched_api_list._get_data.assert_called_with(
         api.STATION_YEAR,
         KEY, SECRET,
@@ -223,89 +110,51 @@ async def test_station_year_valid(api_instance, patched_api_list):
     result = await api_instance.station_year(
         KEY, SECRET,
         currency='EUR', year='2023', nmi_code=NMI)
-    assert result == VALID_RESPONSE_LIST
+    assert result is VALID_RESPONSE_LIST
     patched_api_list._get_data.assert_called_with(
         api.STATION_YEAR,
         KEY, SECRET,
         {'money': 'EUR', 'year': '2023', 'nmiCode': NMI})
 
 
-@pytest.mark.asyncio
-async def test_station_year_invalid_params(api_instance):
-    # ID and SN together
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_year(
-            KEY, SECRET,
-            currency='EUR', year='2023')
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_year(
-            KEY, SECRET,
-            currency='EUR', year='2023', station_id='1000', nmi_code=NMI)
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_year(
-            KEY, SECRET,
-            currency='EUR', year='22023', station_id='1000')
-
-
 @pytest.mark.asyncio
 async def test_station_all_valid(api_instance, patched_api_list):
     # Required arguments only
     result = await api_instance.station_all(
         KEY, SECRET,
         currency='EUR', station_id='1000')
-    assert result == VALID_RESPONSE_LIST
+    assert result is VALID_RESPONSE_LIST
     patched_api_list._get_data.assert_called_with(
         api.STATION_ALL, KEY, SECRET, {'money': 'EUR', 'id': '1000'})
 
     result = await api_instance.station_all(
         KEY, SECRET,
         currency='EUR', nmi_code=NMI)
-    assert result == VALID_RESPONSE_LIST
+    assert result is VALID_RESPONSE_LIST
     patched_api_list._get_data.assert_called_with(
         api.STATION_ALL, KEY, SECRET, {'money': 'EUR', 'nmiCode': NMI})
 
 
-@pytest.mark.asyncio
-async def test_station_all_invalid_params(api_instance):
-    # ID and SN together
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_all(KEY, SECRET, currency='EUR')
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_all(
-            KEY, SECRET,
-            currency='EUR', station_id='1000', nmi_code=NMI)
-
-
 @pytest.mark.asyncio
 async def test_station_detail_list_valid(api_instance, patched_api_records):
     # Required arguments only
     result = await api_instance.station_detail_list(KEY, SECRET)
-    assert result == VALID_RESPONSE_RECORDS
+    assert result is VALID_RESPONSE_RECORDS
     patched_api_records._get_records.assert_called_with(
         api.STATION_DETAIL_LIST,
         KEY, SECRET,
-        {'pageNo': 1, 'pageSize': 20})
+        DEFAULT_PAGING)
 
     result = await api_instance.station_detail_list(
         KEY, SECRET,
         page_no=4, page_size=30)
-    assert result == VALID_RESPONSE_RECORDS
+    assert result is VALID_RESPONSE_RECORDS
     patched_api_records._get_records.assert_called_with(
         api.STATION_DETAIL_LIST,
         KEY, SECRET,
         {'pageNo': 4, 'pageSize': 30})
 
 
-@pytest.mark.asyncio
-async def test_station_detail_list_invalid_params(api_instance):
-    # Wrong page_size
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_detail_list(KEY, SECRET, page_size=1000)
-
-
 @pytest.mark.asyncio
 async def test_station_day_energy_list_valid(
         api_instance, patched_api_records):
@@ -313,46 +162,22 @@ async def test_station_day_energy_list_valid(
     result = await api_instance.station_day_energy_list(
         KEY, SECRET,
         time='2023-01-01')
-    assert result == VALID_RESPONSE_RECORDS
+    assert result is VALID_RESPONSE_RECORDS
     patched_api_records._get_records.assert_called_with(
         api.STATION_DAY_ENERGY_LIST,
         KEY, SECRET,
-        {'pageNo': 1, 'pageSize': 20, 'time': '2023-01-01'})
+        {**DEFAULT_PAGING, 'time': '2023-01-01'})
 
     result = await api_instance.station_day_energy_list(
         KEY, SECRET,
         page_no=4, page_size=30, time='2023-01-01')
-    assert result == VALID_RESPONSE_RECORDS
+    assert result is VALID_RESPONSE_RECORDS
     patched_api_records._get_records.assert_called_with(
         api.STATION_DAY_ENERGY_LIST,
         KEY, SECRET,
         {'pageNo': 4, 'pageSize': 30, 'time': '2023-01-01'})
 
 
-@pytest.mark.asyncio
-async def test_station_day_energy_list_invalid_params(api_instance):
-    # Wrong page_size
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_day_energy_list(
-            KEY, SECRET,
-            page_size=1000, time='2023-01-01')
-    # Wrong time format
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_day_energy_list(
-            KEY, SECRET,
-            time='2023')
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_day_energy_list(
-            KEY, SECRET,
-            time='2023+01-01')
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_day_energy_list(
-            KEY, SECRET,
-            time='2023-01+01')
-
-
 @pytest.mark.asyncio
 async def test_station_month_energy_list_valid(
         api_instance, patched_api_records):
@@ -360,41 +185,22 @@ async def test_station_month_energy_list_valid(
     result = await api_instance.station_month_energy_list(
         KEY, SECRET,
         month='2023-01')
-    assert result == VALID_RESPONSE_RECORDS
+    assert result is VALID_RESPONSE_RECORDS
     patched_api_records._get_records.assert_called_with(
         api.STATION_MONTH_ENERGY_LIST,
         KEY, SECRET,
-        {'pageNo': 1, 'pageSize': 20, 'time': '2023-01'})
+        {**DEFAULT_PAGING, 'time': '2023-01'})
 
     result = await api_instance.station_month_energy_list(
         KEY, SECRET,
         page_no=4, page_size=30, month='2023-01')
-    assert result == VALID_RESPONSE_RECORDS
+    assert result is VALID_RESPONSE_RECORDS
     patched_api_records._get_records.assert_called_with(
         api.STATION_MONTH_ENERGY_LIST,
         KEY, SECRET,
         {'pageNo': 4, 'pageSize': 30, 'time': '2023-01'})
 
 
-@pytest.mark.asyncio
-async def test_station_month_energy_list_invalid_params(api_instance):
-    # Wrong page_size
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_month_energy_list(
-            KEY, SECRET,
-            page_size=1000, month='2023-01')
-    # Wrong month format
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_month_energy_list(
-            KEY, SECRET,
-            month='2023')
-
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_month_energy_list(
-            KEY, SECRET,
-            month='2023+01')
-
-
 @pytest.mark.asyncio
 async def test_station_year_energy_list_valid(
         api_instance, patched_api_records):
@@ -402,31 +208,118 @@ async def test_station_year_energy_list_valid(
     result = await api_instance.station_year_energy_list(
         KEY, SECRET,
         year='2023')
-    assert result == VALID_RESPONSE_RECORDS
+    assert result is VALID_RESPONSE_RECORDS
     patched_api_records._get_records.assert_called_with(
         api.STATION_YEAR_ENERGY_LIST,
         KEY, SECRET,
-        {'pageNo': 1, 'pageSize': 20, 'time': '2023'})
+        {**DEFAULT_PAGING, 'time': '2023'})
 
     result = await api_instance.station_year_energy_list(
         KEY, SECRET,
         page_no=4, page_size=30, year='2023')
-    assert result == VALID_RESPONSE_RECORDS
+    assert result is VALID_RESPONSE_RECORDS
     patched_api_records._get_records.assert_called_with(
         api.STATION_YEAR_ENERGY_LIST,
         KEY, SECRET,
         {'pageNo': 4, 'pageSize': 30, 'time': '2023'})
 
 
+@pytest.mark.parametrize('method,kwargs', [
+    pytest.param(
+        'user_station_list', {'page_size': 101},
+        id='user-station-list'),
+    pytest.param(
+        'station_detail_list', {'page_size': 1000},
+        id='station-detail-list'),
+    pytest.param(
+        'station_day_energy_list', {'page_size': 1000, 'time': '2023-01-01'},
+        id='station-day-energy-list'),
+    pytest.param(
+        'station_month_energy_list', {'page_size': 1000, 'month': '2023-01'},
+        id='station-month-energy-list'),
+    pytest.param(
+        'station_year_energy_list', {'page_size': 1000, 'year': '2023'},
+        id='station-year-energy-list'),
+])
 @pytest.mark.asyncio
-async def test_station_year_energy_list_invalid_params(api_instance):
-    # Wrong page_size
-    with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_year_energy_list(
-            KEY, SECRET,
-            page_size=1000, year='2023')
-    # Wrong year format
+async def test_invalid_page_size(api_instance, method, kwargs):
+    with pytest.raises(
+            api.SoliscloudAPI.SolisCloudError, match=api.PAGE_SIZE_ERR):
+        await getattr(api_instance, method)(KEY, SECRET, **kwargs)
+
+
+@pytest.mark.parametrize('method,kwargs,message', [
+    pytest.param(
+        'station_day', {
+            'currency': 'EUR', 'time': '2023-01-01', 'time_zone': 1},
+        api.ONLY_STN_ID_OR_SN_ERR,
+        id='station-day-no-id-and-no-nmi'),
+    pytest.param(
+        'station_day', {
+            'currency': 'EUR', 'time': '2023-01-01', 'time_zone': 1,
+            'station_id': '1000', 'nmi_code': NMI},
+        api.ONLY_STN_ID_OR_SN_ERR,
+        id='station-day-both-id-and-nmi'),
+    pytest.param(
+        'station_month', {'currency': 'EUR', 'month': '2023-01'},
+        api.ONLY_STN_ID_OR_SN_ERR,
+        id='station-month-no-id-and-no-nmi'),
+    pytest.param(
+        'station_month', {
+            'currency': 'EUR', 'month': '2023-01',
+            'station_id': '1000', 'nmi_code': NMI},
+        api.ONLY_STN_ID_OR_SN_ERR,
+        id='station-month-both-id-and-nmi'),
+    pytest.param(
+        'station_year', {'currency': 'EUR', 'year': '2023'},
+        api.ONLY_STN_ID_OR_SN_ERR,
+        id='station-year-no-id-and-no-nmi'),
+    pytest.param(
+        'station_year', {
+            'currency': 'EUR', 'year': '2023',
+            'station_id': '1000', 'nmi_code': NMI},
+        api.ONLY_STN_ID_OR_SN_ERR,
+        id='station-year-both-id-and-nmi'),
+    pytest.param(
+        'station_all', {'currency': 'EUR'},
+        api.ONLY_STN_ID_OR_SN_ERR,
+        id='station-all-no-id-and-no-nmi'),
+    pytest.param(
+        'station_all', {
+            'currency': 'EUR', 'station_id': '1000', 'nmi_code': NMI},
+        api.ONLY_STN_ID_OR_SN_ERR,
+        id='station-all-both-id-and-nmi'),
+])
+@pytest.mark.asyncio
+async def test_invalid_params(api_instance, method, kwargs, message):
+    with pytest.raises(api.SoliscloudAPI.SolisCloudError, match=message):
+        await getattr(api_instance, method)(KEY, SECRET, **kwargs)
+
+
+@pytest.mark.parametrize('method,kwargs', [
+    ('station_day', {
+        'currency': 'EUR', 'station_id': '1000',
+        'time': '2023', 'time_zone': 1}),
+    ('station_day', {
+        'currency': 'EUR', 'station_id': '1000',
+        'time': '2023+01-01', 'time_zone': 1}),
+    ('station_day', {
+        'currency': 'EUR', 'station_id': '1000',
+        'time': '2023-01+01', 'time_zone': 1}),
+    ('station_month', {
+        'currency': 'EUR', 'station_id': '1000', 'month': '2023'}),
+    ('station_month', {
+        'currency': 'EUR', 'station_id': '1000', 'month': '2023+01'}),
+    ('station_year', {
+        'currency': 'EUR', 'station_id': '1000', 'year': '22023'}),
+    ('station_day_energy_list', {'time': '2023'}),
+    ('station_day_energy_list', {'time': '2023+01-01'}),
+    ('station_day_energy_list', {'time': '2023-01+01'}),
+    ('station_month_energy_list', {'month': '2023'}),
+    ('station_month_energy_list', {'month': '2023+01'}),
+    ('station_year_energy_list', {'year': '22023'}),
+])
+@pytest.mark.asyncio
+async def test_invalid_date_format(api_instance, method, kwargs):
     with pytest.raises(api.SoliscloudAPI.SolisCloudError):
-        await api_instance.station_year_energy_list(
-            KEY, SECRET,
-            year='22023')
+        await getattr(api_instance, method)(KEY, SECRET, **kwargs)